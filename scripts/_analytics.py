@@ -0,0 +1,131 @@
+"""
+Shared Analytics Helpers
+========================
+Aggregations over the typed columns returned by _loader, and the headline
+metrics the reports build from them.
+"""
+
+import heapq
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Optional
+
+def group_means(keys, values):
+    """Average values per key in one pass, returning (averages, counts)"""
+    sums = defaultdict(float)
+    for key, value in zip(keys, values):
+        sums[key] += value
+    
+    counts = Counter(keys)
+    averages = {key: total / counts[key] for key, total in sums.items()}
+    return averages, counts
+
+def group_stats(keys, values):
+    """Count, mean, min and max of values per key in one pass"""
+    totals = {}
+    for key, value in zip(keys, values):
+        entry = totals.get(key)
+        if entry is None:
+            totals[key] = [1, value, value, value]
+        else:
+            entry[0] += 1
+            entry[1] += value
+            if value < entry[2]:
+                entry[2] = value
+            elif value > entry[3]:
+                entry[3] = value
+    
+    return {
+        key: {'count': count, 'mean': total / count, 'min': low, 'max': high}
+        for key, (count, total, low, high) in totals.items()
+    }
+
+def top_n_by_group(groups, n=5):
+    """The n groups with the highest mean, as (key, mean) pairs, from group_stats output"""
+    means = ((key, stats['mean']) for key, stats in groups.items())
+    return heapq.nlargest(n, means, key=itemgetter(1))
+
+def as_pct(counts, total):
+    """Convert a mapping of counts into percentages of total"""
+    return {key: (count / total) * 100 for key, count in counts.items()}
+
+def distribution(values):
+    """Map each distinct value to its (count, percentage of all values)"""
+    counts = Counter(values)
+    percentages = as_pct(counts, len(values))
+    return {value: (count, percentages[value]) for value, count in counts.items()}
+
+def group_distinct(keys, values):
+    """Count distinct values per key"""
+    seen = defaultdict(set)
+    for key, value in zip(keys, values):
+        seen[key].add(value)
+    return {key: len(values_seen) for key, values_seen in seen.items()}
+
+# Satisfaction cut-offs for the C, B and A performance grades
+GRADE_THRESHOLDS = (3.0, 3.5, 4.0)
+
+def grade_index(score):
+    """Grade band of a satisfaction score, from 0 (below 3.0) to 3 (4.0 and above)"""
+    return bisect_right(GRADE_THRESHOLDS, score)
+
+def count_distinct(table, names):
+    """Count distinct values for each of the named columns"""
+    return {name: len(set(table[name])) for name in names}
+
+# Grouping columns whose satisfaction statistics are shared across report sections
+CONTEXT_GROUPS = {
+    'by_instructor': 'instructor_id',
+    'by_course': 'course_id',
+    'by_semester': 'semester',
+    'by_department': 'department',
+}
+
+def build_context(table):
+    """Compute overall and per-group satisfaction statistics once for all report sections"""
+    satisfaction_scores = table['satisfaction_score']
+    context = {
+        'table': table,
+        'avg_satisfaction': sum(satisfaction_scores) / len(satisfaction_scores),
+    }
+    for name, column in CONTEXT_GROUPS.items():
+        if column in table:
+            context[name] = group_stats(table[column], satisfaction_scores)
+    return context
+
+@dataclass
+class Metrics:
+    """Headline figures shared by the summary, HTML and analysis reports"""
+    total_records: int
+    avg_satisfaction: float
+    avg_engagement: Optional[float]  # None when the data has no engagement_score column
+    performance_dist: dict
+    difficulty_dist: dict
+    top_instructors: list
+    top_courses: list
+    unique_students: int
+    unique_courses: int
+    unique_instructors: int
+    unique_semesters: int
+
+def compute_metrics(context):
+    """Compute the headline metrics once from a build_context result"""
+    table = context['table']
+    engagement_scores = table.get('engagement_score')
+    unique = count_distinct(table, ('student_id', 'course_id', 'instructor_id', 'semester'))
+    
+    return Metrics(
+        total_records=len(table['satisfaction_score']),
+        avg_satisfaction=context['avg_satisfaction'],
+        avg_engagement=sum(engagement_scores) / len(engagement_scores) if engagement_scores else None,
+        performance_dist=distribution(table['performance_category']),
+        difficulty_dist=distribution(table['difficulty_category']),
+        top_instructors=top_n_by_group(context['by_instructor']),
+        top_courses=top_n_by_group(context['by_course']),
+        unique_students=unique['student_id'],
+        unique_courses=unique['course_id'],
+        unique_instructors=unique['instructor_id'],
+        unique_semesters=unique['semester'],
+    )
@@ -0,0 +1,175 @@
+"""
+Shared Data Loader
+==================
+Loads processed feedback data as typed columns for the analysis scripts,
+caching each parsed column next to the CSV. Aggregations over the columns
+live in _analytics.
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+from array import array
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+PROCESSED_FILE = Path("data/processed/processed_feedback.csv")
+
+# Columns are converted once per column at load time. Low-cardinality text
+# columns are interned so each distinct value is a single shared string,
+# which keeps memory down and makes grouping on them cheap.
+COLUMN_TYPES = {
+    'satisfaction_score': float,
+    'engagement_score': float,
+    'overall_rating': int,
+    'difficulty_level': int,
+    'student_id': sys.intern,
+    'course_id': sys.intern,
+    'instructor_id': sys.intern,
+    'semester': sys.intern,
+    'department': sys.intern,
+    'difficulty_category': sys.intern,
+    'performance_category': sys.intern,
+}
+
+# Numeric columns are stored in compact typed arrays instead of one Python
+# object per value. Scores stay double precision so threshold checks such
+# as engagement > 0.8 behave exactly as on the CSV values; the 1-5 ratings
+# fit in int8.
+ARRAY_TYPECODES = {
+    'satisfaction_score': 'd',
+    'engagement_score': 'd',
+    'overall_rating': 'b',
+    'difficulty_level': 'b',
+}
+
+# Rows converted per batch; bounds the transient row buffer while loading
+BATCH_SIZE = 8192
+
+def read_header(file_path):
+    """Return the column names from the first line of a CSV file"""
+    with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+        return next(csv.reader(csvfile), [])
+
+def read_columns(file_path, columns=None, batch_size=BATCH_SIZE):
+    """Parse a CSV file into a dict of typed columns, one batch of rows at a time"""
+    with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        
+        # Only the requested columns are converted and kept
+        selected = [
+            (position, name)
+            for position, name in enumerate(header)
+            if columns is None or name in columns
+        ]
+        converters = [COLUMN_TYPES.get(name) for _, name in selected]
+        table = {
+            name: array(ARRAY_TYPECODES[name]) if name in ARRAY_TYPECODES else []
+            for _, name in selected
+        }
+        
+        while True:
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                break
+            
+            # Skip blank lines, as csv.DictReader does
+            batch = list(zip(*filter(None, rows)))
+            if not batch:
+                continue
+            
+            for (position, name), convert in zip(selected, converters):
+                values = batch[position]
+                table[name].extend(map(convert, values) if convert else values)
+    
+    if not any(table.values()):
+        return {}
+    
+    return table
+
+def write_cache(cache_path, stamp, values):
+    """Write one column's cache file atomically, so concurrent readers never see a partial file
+    
+    The file is a one-line JSON header with the source CSV's stamp, followed by
+    the raw bytes of a typed array or a JSON list of strings. Neither can run
+    code when read back, unlike a pickle.
+    """
+    header = {'mtime_ns': stamp[0], 'size': stamp[1], 'count': len(values)}
+    fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            if isinstance(values, array):
+                values.tofile(f)
+            else:
+                f.write(json.dumps(values, ensure_ascii=False).encode('utf-8'))
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def read_cache(cache_path, name, stamp):
+    """Read one column's cache file, or None if it was not built from this exact CSV"""
+    with open(cache_path, 'rb') as f:
+        header = json.loads(f.readline())
+        if (header['mtime_ns'], header['size']) != stamp:
+            return None
+        
+        if name in ARRAY_TYPECODES:
+            values = array(ARRAY_TYPECODES[name])
+            values.fromfile(f, header['count'])
+        else:
+            values = json.loads(f.read())
+            convert = COLUMN_TYPES.get(name)
+            if convert:
+                values = list(map(convert, values))
+    
+    return values if len(values) == header['count'] else None
+
+def load_cached(file_path, columns=None):
+    """Load typed columns, reusing per-column cache files built from this exact CSV"""
+    file_path = Path(file_path)
+    cache_dir = file_path.with_suffix('.cache')
+    
+    # Each cache file records the mtime and size of the CSV it was built from
+    # and is only used when both still match, so a CSV replaced by an older
+    # copy (cp -p, rsync -a, tar) is not served from a stale cache
+    source = file_path.stat()
+    stamp = (source.st_mtime_ns, source.st_size)
+    
+    if columns is None:
+        columns = read_header(file_path)
+    
+    table = {}
+    missing = []
+    for name in columns:
+        try:
+            values = read_cache(cache_dir / f"{name}.col", name, stamp)
+            if values is not None:
+                table[name] = values
+                continue
+        except Exception:
+            pass  # Missing or unreadable cache, rebuild it from the CSV
+        missing.append(name)
+    
+    if missing:
+        parsed = read_columns(file_path, missing)
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            for name, values in parsed.items():
+                write_cache(cache_dir / f"{name}.col", stamp, values)
+        except OSError:
+            pass  # Caching is best effort, e.g. on a read-only data directory
+        
+        table.update(parsed)
+    
+    return {name: table[name] for name in columns if name in table}
+
+@lru_cache(maxsize=4)
+def load_table(columns=None):
+    """Load the processed feedback columns, reusing earlier loads in this process"""
+    return load_cached(PROCESSED_FILE, columns)
@@ -4,27 +4,28 @@ Basic Charts for Academic Pulse Data
 Creates simple text-based charts and basic analysis.
 """
 
-import csv
-from pathlib import Path
-from collections import Counter, defaultdict
+import heapq
+from collections import Counter
+from operator import itemgetter
 
-def load_data():
-    """Load processed data"""
-    file_path = Path("data/processed/processed_feedback.csv")
+from _analytics import group_means
+from _loader import PROCESSED_FILE, load_table
+
+# Columns read by the chart and correlation functions
+CHART_COLUMNS = (
+    'satisfaction_score', 'engagement_score', 'instructor_id', 'course_id',
+    'semester', 'department', 'performance_category', 'difficulty_category',
+)
+
+def load_data(columns=CHART_COLUMNS):
+    """Load processed data as a dict of typed columns"""
+    file_path = PROCESSED_FILE
     
     if not file_path.exists():
         print("❌ No processed data found.")
         return None
     
-    records = []
-    with open(file_path, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            row['satisfaction_score'] = float(row['satisfaction_score'])
-            row['overall_rating'] = int(row['overall_rating'])
-            records.append(row)
-    
-    return records
+    return load_table(columns)
 
 def create_text_chart(data, title, max_width=50):
     """Create a simple text-based bar chart"""
@@ -39,101 +40,85 @@ def create_text_chart(data, title, max_width=50):
     for label, value in data.items():
         bar_length = int((value / max_value) * max_width)
         bar = "█" * bar_length
-        print(f"{label:15} │{bar:<{max_width}} │ {value}")
+        display = f"{value:.2f}" if isinstance(value, float) else value
+        print(f"{label:15} │{bar:<{max_width}} │ {display}")
 
-def analyze_performance_by_category(records):
+def analyze_performance_by_category(table):
     """Analyze performance by different categories"""
+    scores = table['satisfaction_score']
     
     # Performance distribution
-    performance_dist = Counter(r['performance_category'] for r in records)
+    performance_dist = Counter(table['performance_category'])
     create_text_chart(dict(performance_dist), "Performance Distribution")
     
     # Difficulty distribution
-    difficulty_dist = Counter(r['difficulty_category'] for r in records)
+    difficulty_dist = Counter(table['difficulty_category'])
     create_text_chart(dict(difficulty_dist), "Difficulty Distribution")
     
     # Department performance
-    dept_scores = defaultdict(list)
-    for record in records:
-        dept_scores[record['department']].append(record['satisfaction_score'])
-    
-    dept_averages = {
-        dept: round(sum(scores) / len(scores), 2)
-        for dept, scores in dept_scores.items()
-    }
+    dept_averages, _ = group_means(table['department'], scores)
     create_text_chart(dept_averages, "Average Satisfaction by Department")
     
     # Semester trends
-    semester_scores = defaultdict(list)
-    for record in records:
-        semester_scores[record['semester']].append(record['satisfaction_score'])
-    
-    semester_averages = {
-        semester: round(sum(scores) / len(scores), 2)
-        for semester, scores in semester_scores.items()
-    }
+    semester_averages, _ = group_means(table['semester'], scores)
     create_text_chart(semester_averages, "Average Satisfaction by Semester")
 
-def create_top_performers_chart(records):
+def create_top_performers_chart(table):
     """Show top performing instructors and courses"""
+    scores = table['satisfaction_score']
     
     # Top instructors
-    instructor_scores = defaultdict(list)
-    for record in records:
-        instructor_scores[record['instructor_id']].append(record['satisfaction_score'])
-    
+    instructor_means, instructor_counts = group_means(table['instructor_id'], scores)
     instructor_averages = {
-        instructor: sum(scores) / len(scores)
-        for instructor, scores in instructor_scores.items()
-        if len(scores) >= 5  # At least 5 reviews
+        instructor: avg
+        for instructor, avg in instructor_means.items()
+        if instructor_counts[instructor] >= 5  # At least 5 reviews
     }
     
-    top_instructors = dict(sorted(instructor_averages.items(), key=lambda x: x[1], reverse=True)[:8])
-    top_instructors = {k: round(v, 2) for k, v in top_instructors.items()}
+    top_instructors = dict(heapq.nlargest(8, instructor_averages.items(), key=itemgetter(1)))
     create_text_chart(top_instructors, "Top Instructors (≥5 reviews)")
     
     # Top courses
-    course_scores = defaultdict(list)
-    for record in records:
-        course_scores[record['course_id']].append(record['satisfaction_score'])
-    
+    course_means, course_counts = group_means(table['course_id'], scores)
     course_averages = {
-        course: sum(scores) / len(scores)
-        for course, scores in course_scores.items()
-        if len(scores) >= 3  # At least 3 reviews
+        course: avg
+        for course, avg in course_means.items()
+        if course_counts[course] >= 3  # At least 3 reviews
     }
     
-    top_courses = dict(sorted(course_averages.items(), key=lambda x: x[1], reverse=True)[:8])
-    top_courses = {k: round(v, 2) for k, v in top_courses.items()}
+    top_courses = dict(heapq.nlargest(8, course_averages.items(), key=itemgetter(1)))
     create_text_chart(top_courses, "Top Courses (≥3 reviews)")
 
-def create_correlation_analysis(records):
+def create_correlation_analysis(table):
     """Analyze correlations between different metrics"""
     print(f"\n📈 CORRELATION ANALYSIS")
     print("=" * 25)
+    scores = table['satisfaction_score']
     
     # Difficulty vs Satisfaction
-    easy_courses = [r for r in records if r['difficulty_category'] == 'Easy']
-    hard_courses = [r for r in records if r['difficulty_category'] == 'Very Hard']
+    difficulty_means, difficulty_counts = group_means(table['difficulty_category'], scores)
     
-    if easy_courses and hard_courses:
-        easy_avg = sum(r['satisfaction_score'] for r in easy_courses) / len(easy_courses)
-        hard_avg = sum(r['satisfaction_score'] for r in hard_courses) / len(hard_courses)
+    if difficulty_counts['Easy'] and difficulty_counts['Very Hard']:
+        easy_avg = difficulty_means['Easy']
+        hard_avg = difficulty_means['Very Hard']
         
-        print(f"Easy courses satisfaction: {easy_avg:.2f}/5 (n={len(easy_courses)})")
-        print(f"Very hard courses satisfaction: {hard_avg:.2f}/5 (n={len(hard_courses)})")
+        print(f"Easy courses satisfaction: {easy_avg:.2f}/5 (n={difficulty_counts['Easy']})")
+        print(f"Very hard courses satisfaction: {hard_avg:.2f}/5 (n={difficulty_counts['Very Hard']})")
         print(f"Difference: {easy_avg - hard_avg:.2f} points")
     
-    # Engagement vs Satisfaction
-    high_engagement = [r for r in records if r['engagement_score'] > '0.8']
-    low_engagement = [r for r in records if r['engagement_score'] < '0.6']
+    # Engagement vs Satisfaction (engagement_score is numeric, not a string)
+    engagement_bands = [
+        'high' if e > 0.8 else 'low' if e < 0.6 else 'mid'
+        for e in table['engagement_score']
+    ]
+    engagement_means, engagement_counts = group_means(engagement_bands, scores)
     
-    if high_engagement and low_engagement:
-        high_sat = sum(r['satisfaction_score'] for r in high_engagement) / len(high_engagement)
-        low_sat = sum(r['satisfaction_score'] for r in low_engagement) / len(low_engagement)
+    if engagement_counts['high'] and engagement_counts['low']:
+        high_sat = engagement_means['high']
+        low_sat = engagement_means['low']
         
-        print(f"\nHigh engagement satisfaction: {high_sat:.2f}/5 (n={len(high_engagement)})")
-        print(f"Low engagement satisfaction: {low_sat:.2f}/5 (n={len(low_engagement)})")
+        print(f"\nHigh engagement satisfaction: {high_sat:.2f}/5 (n={engagement_counts['high']})")
+        print(f"Low engagement satisfaction: {low_sat:.2f}/5 (n={engagement_counts['low']})")
         print(f"Difference: {high_sat - low_sat:.2f} points")
 
 def main():
@@ -141,17 +126,17 @@ def main():
     print("📊 ACADEMIC PULSE - DATA VISUALIZATION")
     print("=" * 45)
     
-    records = load_data()
-    if not records:
+    table = load_data()
+    if not table:
         print("Run the ETL pipeline first: python3 scripts/run_complete_etl.py")
         return
     
-    print(f"📖 Analyzing {len(records)} feedback records...")
+    print(f"📖 Analyzing {len(table['satisfaction_score'])} feedback records...")
     
     # Create various analyses
-    analyze_performance_by_category(records)
-    create_top_performers_chart(records)
-    create_correlation_analysis(records)
+    analyze_performance_by_category(table)
+    create_top_performers_chart(table)
+    create_correlation_analysis(table)
     
     print(f"\n🎉 Analysis complete!")
     print(f"💡 Insights:")
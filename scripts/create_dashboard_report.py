@@ -4,16 +4,30 @@ Dashboard Summary Report Generator
 Creates a quick dashboard-style report in text format.
 """
 
-import csv
+import heapq
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import Counter
+from operator import itemgetter
 import datetime
 
+from _analytics import as_pct, count_distinct, grade_index, group_means
+from _loader import PROCESSED_FILE, load_table
+
+# Columns read by generate_dashboard_content
+REPORT_COLUMNS = (
+    'satisfaction_score', 'engagement_score', 'overall_rating',
+    'student_id', 'course_id', 'instructor_id', 'semester',
+    'performance_category', 'difficulty_category',
+)
+
+# Instructor grade labels indexed by grade_index(satisfaction)
+GRADES = ("C - Fair ⚠️", "C - Fair ⚠️", "B - Good ✅", "A - Excellent ⭐")
+
 def create_dashboard_report():
     """Create a dashboard-style summary report"""
     
     # Load processed data
-    data_file = Path("data/processed/processed_feedback.csv")
+    data_file = PROCESSED_FILE
     if not data_file.exists():
         print("❌ No processed data found. Run the ETL pipeline first!")
         return
@@ -22,17 +36,16 @@ def create_dashboard_report():
     reports_dir = Path("reports")
     reports_dir.mkdir(exist_ok=True)
     
-    # Load data
-    records = []
-    with open(data_file, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            records.append(row)
+    # Load data as typed columns
+    table = load_table(REPORT_COLUMNS)
     
-    print(f"📊 Creating dashboard report for {len(records)} records...")
+    print(f"📊 Creating dashboard report for {len(table['satisfaction_score'])} records...")
+    
+    # One timestamp for every section of this report
+    generated_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     # Generate dashboard report
-    dashboard_content = generate_dashboard_content(records)
+    dashboard_content = generate_dashboard_content(table, generated_at)
     
     # Save dashboard report
     dashboard_file = reports_dir / "Dashboard_Summary.txt"
@@ -41,50 +54,49 @@ def create_dashboard_report():
     
     print(f"✅ Dashboard Report created: {dashboard_file}")
 
-def generate_dashboard_content(records):
+def _bar(percentage):
+    """Render a percentage as a 50-character text bar"""
+    filled = int(percentage / 2)  # Scale down for text display
+    return ("█" * filled).ljust(50, "░")
+
+def generate_dashboard_content(table, generated_at):
     """Generate the dashboard content"""
     
-    current_date = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    total_records = len(records)
-    
     # Calculate metrics
-    satisfaction_scores = [float(r['satisfaction_score']) for r in records]
-    engagement_scores = [float(r['engagement_score']) for r in records]
-    overall_ratings = [int(r['overall_rating']) for r in records]
+    satisfaction_scores = table['satisfaction_score']
+    engagement_scores = table['engagement_score']
+    overall_ratings = table['overall_rating']
+    total_records = len(satisfaction_scores)
     
     avg_satisfaction = sum(satisfaction_scores) / len(satisfaction_scores)
     avg_engagement = sum(engagement_scores) / len(engagement_scores)
     avg_overall = sum(overall_ratings) / len(overall_ratings)
     
     # Unique counts
-    unique_students = len(set(r['student_id'] for r in records))
-    unique_courses = len(set(r['course_id'] for r in records))
-    unique_instructors = len(set(r['instructor_id'] for r in records))
-    unique_semesters = len(set(r['semester'] for r in records))
+    unique = count_distinct(table, ('student_id', 'course_id', 'instructor_id', 'semester'))
+    unique_students = unique['student_id']
+    unique_courses = unique['course_id']
+    unique_instructors = unique['instructor_id']
+    unique_semesters = unique['semester']
     
     # Distributions
-    performance_dist = Counter(r['performance_category'] for r in records)
-    difficulty_dist = Counter(r['difficulty_category'] for r in records)
+    performance_dist = Counter(table['performance_category'])
+    difficulty_dist = Counter(table['difficulty_category'])
+    performance_pct = as_pct(performance_dist, total_records)
+    difficulty_pct = as_pct(difficulty_dist, total_records)
     
     # Top performers
-    instructor_scores = defaultdict(list)
-    for record in records:
-        instructor_scores[record['instructor_id']].append(float(record['satisfaction_score']))
-    
-    instructor_averages = {
-        instructor: sum(scores) / len(scores)
-        for instructor, scores in instructor_scores.items()
-    }
-    top_instructors = sorted(instructor_averages.items(), key=lambda x: x[1], reverse=True)[:3]
+    instructor_averages, _ = group_means(table['instructor_id'], satisfaction_scores)
+    top_instructors = heapq.nlargest(3, instructor_averages.items(), key=itemgetter(1))
     
     # Generate content
-    content = f"""
+    parts = [f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                      🎓 ACADEMIC PULSE ETL DASHBOARD                         ║
 ║                        Student Feedback Analytics                            ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 
-📅 Report Generated: {current_date}
+📅 Report Generated: {generated_at}
 📊 Data Coverage: {total_records:,} feedback records
 
 ╔══════════════════════════════════════════════════════════════════════════════╗
@@ -111,34 +123,32 @@ def generate_dashboard_content(records):
 ║                         PERFORMANCE DISTRIBUTION                            ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 
-"""
+"""]
 
     # Add performance distribution with visual bars
     for category in ['Excellent', 'Good', 'Fair', 'Poor']:
         count = performance_dist.get(category, 0)
-        percentage = (count / total_records) * 100 if total_records > 0 else 0
-        bar_length = int(percentage / 2)  # Scale down for text display
-        bar = "█" * bar_length + "░" * (50 - bar_length)
+        percentage = performance_pct.get(category, 0)
+        bar = _bar(percentage)
         
-        content += f"{category:12} │{bar}│ {count:3d} ({percentage:5.1f}%)\n"
+        parts.append(f"{category:12} │{bar}│ {count:3d} ({percentage:5.1f}%)\n")
 
-    content += f"""
+    parts.append(f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                         DIFFICULTY DISTRIBUTION                             ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 
-"""
+""")
 
     # Add difficulty distribution
     for category in ['Easy', 'Moderate', 'Hard', 'Very Hard']:
         count = difficulty_dist.get(category, 0)
-        percentage = (count / total_records) * 100 if total_records > 0 else 0
-        bar_length = int(percentage / 2)
-        bar = "█" * bar_length + "░" * (50 - bar_length)
+        percentage = difficulty_pct.get(category, 0)
+        bar = _bar(percentage)
         
-        content += f"{category:12} │{bar}│ {count:3d} ({percentage:5.1f}%)\n"
+        parts.append(f"{category:12} │{bar}│ {count:3d} ({percentage:5.1f}%)\n")
 
-    content += f"""
+    parts.append(f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                           TOP PERFORMERS                                    ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -146,20 +156,14 @@ def generate_dashboard_content(records):
 🏆 TOP INSTRUCTORS BY SATISFACTION:
 ┌──────┬─────────────────┬─────────────────┬─────────────────────────────────┐
 │ Rank │ Instructor ID   │ Rating          │ Grade                           │
-├──────┼─────────────────┼─────────────────┼─────────────────────────────────┤"""
+├──────┼─────────────────┼─────────────────┼─────────────────────────────────┤""")
 
     for i, (instructor, score) in enumerate(top_instructors, 1):
-        if score >= 4.0:
-            grade = "A - Excellent ⭐"
-        elif score >= 3.5:
-            grade = "B - Good ✅"
-        else:
-            grade = "C - Fair ⚠️"
-        
-        content += f"""
-│  {i:2d}  │ {instructor:15} │ {score:13.2f}/5 │ {grade:31} │"""
+        grade = GRADES[grade_index(score)]
+        parts.append(f"""
+│  {i:2d}  │ {instructor:15} │ {score:13.2f}/5 │ {grade:31} │""")
 
-    content += f"""
+    parts.append(f"""
 └──────┴─────────────────┴─────────────────┴─────────────────────────────────┘
 
 ╔══════════════════════════════════════════════════════════════════════════════╗
@@ -168,26 +172,26 @@ def generate_dashboard_content(records):
 
 💡 ACTIONABLE RECOMMENDATIONS:
 
-"""
+""")
 
     # Generate insights
-    excellent_pct = (performance_dist.get('Excellent', 0) / total_records) * 100
-    poor_pct = (performance_dist.get('Poor', 0) / total_records) * 100
+    excellent_pct = performance_pct.get('Excellent', 0.0)
+    poor_pct = performance_pct.get('Poor', 0.0)
     
     if avg_satisfaction >= 4.0:
-        content += "✅ STRENGTH: Outstanding overall satisfaction score!\n"
+        parts.append("✅ STRENGTH: Outstanding overall satisfaction score!\n")
     elif avg_satisfaction >= 3.5:
-        content += "👍 GOOD: Solid satisfaction levels with room for growth.\n"
+        parts.append("👍 GOOD: Solid satisfaction levels with room for growth.\n")
     else:
-        content += "⚠️  FOCUS: Satisfaction needs immediate attention.\n"
+        parts.append("⚠️  FOCUS: Satisfaction needs immediate attention.\n")
 
     if excellent_pct > 20:
-        content += f"🌟 HIGHLIGHT: {excellent_pct:.1f}% excellent performance rate exceeds expectations.\n"
+        parts.append(f"🌟 HIGHLIGHT: {excellent_pct:.1f}% excellent performance rate exceeds expectations.\n")
     
     if poor_pct > 20:
-        content += f"🚨 ALERT: {poor_pct:.1f}% of courses need urgent improvement.\n"
+        parts.append(f"🚨 ALERT: {poor_pct:.1f}% of courses need urgent improvement.\n")
     
-    content += f"""
+    parts.append(f"""
 📋 STRATEGIC PRIORITIES:
    1. Share best practices from {top_instructors[0][0]} (top performer: {top_instructors[0][1]:.2f}/5)
    2. {"Focus on excellence programs" if excellent_pct < 25 else "Maintain excellence standards"}
@@ -200,12 +204,12 @@ def generate_dashboard_content(records):
 
 📊 Generated by Academic Pulse ETL System
 🐍 Built with Python | 📈 Data-Driven Academic Excellence
-🔄 Last Updated: {current_date}
+🔄 Last Updated: {generated_at}
 
 End of Report
-"""
+""")
 
-    return content
+    return "".join(parts)
 
 if __name__ == "__main__":
     create_dashboard_report()
@@ -4,9 +4,20 @@ Academic Pulse Dashboard
 Interactive dashboard for exploring the data.
 """
 
-import csv
-from pathlib import Path
-from collections import Counter
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+from _analytics import as_pct
+from _loader import PROCESSED_FILE, load_table
+
+# Star ratings for whole-number scores 0-5
+STARS = ["★" * i + "☆" * (5 - i) for i in range(6)]
+
+# Columns read by the dashboard views
+DASHBOARD_COLUMNS = (
+    'satisfaction_score', 'difficulty_level', 'instructor_id', 'course_id',
+    'semester', 'performance_category',
+)
 
 def main_menu():
     """Display main menu"""
@@ -23,53 +34,53 @@ def main_menu():
     choice = input("Select option (0-5): ").strip()
     return choice
 
-def load_data():
-    """Load processed data"""
-    file_path = Path("data/processed/processed_feedback.csv")
+def load_data(columns=DASHBOARD_COLUMNS):
+    """Load processed data as a dict of typed columns"""
+    file_path = PROCESSED_FILE
     if not file_path.exists():
         print("❌ No data found. Run ETL pipeline first!")
         return None
     
-    records = []
-    with open(file_path, 'r') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            records.append(row)
-    return records
+    return load_table(columns)
+
+def build_index(table, columns=('instructor_id', 'course_id', 'semester')):
+    """Map each value of the searchable columns to its row positions"""
+    index = {}
+    for name in columns:
+        positions = defaultdict(list)
+        for i, value in enumerate(table[name]):
+            positions[value].append(i)
+        index[name] = dict(positions)
+    return index
 
-def quick_overview(records):
+def quick_overview(table):
     """Show quick overview"""
     print("\n📊 QUICK OVERVIEW")
     print("-" * 30)
-    total = len(records)
-    avg_satisfaction = sum(float(r['satisfaction_score']) for r in records) / total
+    scores = table['satisfaction_score']
+    total = len(scores)
+    avg_satisfaction = sum(scores) / total
     
     print(f"Total Records: {total}")
     print(f"Average Satisfaction: {avg_satisfaction:.2f}/5")
     
-    performance_dist = Counter(r['performance_category'] for r in records)
+    performance_dist = Counter(table['performance_category'])
     print("\nPerformance Distribution:")
+    performance_pct = as_pct(performance_dist, total)
     for category, count in performance_dist.most_common():
-        pct = (count / total) * 100
+        pct = performance_pct[category]
         bar = "█" * int(pct / 5)
         print(f"  {category:<10}: {bar:<20} {pct:5.1f}%")
 
-def instructor_rankings(records):
+def instructor_rankings(table):
     """Show instructor rankings"""
     print("\n🏆 INSTRUCTOR RANKINGS")
     print("-" * 35)
     
-    instructor_scores = {}
-    instructor_counts = {}
+    instructor_scores = defaultdict(float)
+    instructor_counts = defaultdict(int)
     
-    for record in records:
-        instructor = record['instructor_id']
-        score = float(record['satisfaction_score'])
-        
-        if instructor not in instructor_scores:
-            instructor_scores[instructor] = 0
-            instructor_counts[instructor] = 0
-        
+    for instructor, score in zip(table['instructor_id'], table['satisfaction_score']):
         instructor_scores[instructor] += score
         instructor_counts[instructor] += 1
     
@@ -80,15 +91,15 @@ def instructor_rankings(records):
         count = instructor_counts[instructor]
         instructor_averages.append((instructor, avg, count))
     
-    instructor_averages.sort(key=lambda x: x[1], reverse=True)
+    instructor_averages.sort(key=itemgetter(1), reverse=True)
     
-    print("Rank │ Instructor │ Rating │ Reviews")
-    print("─────┼────────────┼────────┼────────")
+    print("Rank │ Instructor │ Rating │ Reviews │ Stars")
+    print("─────┼────────────┼────────┼─────────┼──────")
     for i, (instructor, avg, count) in enumerate(instructor_averages, 1):
-        stars = "★" * int(avg) + "☆" * (5 - int(avg))
-        print(f"{i:4} │ {instructor:<10} │ {avg:6.2f} │ {count:7}")
+        stars = STARS[int(avg)]
+        print(f"{i:4} │ {instructor:<10} │ {avg:6.2f} │ {count:7} │ {stars}")
 
-def custom_search(records):
+def custom_search(table, index):
     """Custom search functionality"""
     print("\n🔍 CUSTOM SEARCH")
     print("-" * 25)
@@ -100,48 +111,53 @@ def custom_search(records):
     
     if choice == "1":
         instructor_id = input("Enter instructor ID (e.g., INST01): ").strip().upper()
-        matching = [r for r in records if r['instructor_id'] == instructor_id]
+        matching = index['instructor_id'].get(instructor_id, [])
         
         if matching:
-            avg_score = sum(float(r['satisfaction_score']) for r in matching) / len(matching)
+            avg_score = sum(table['satisfaction_score'][i] for i in matching) / len(matching)
             print(f"\n{instructor_id} Results:")
             print(f"  Reviews: {len(matching)}")
             print(f"  Average Rating: {avg_score:.2f}/5")
             
-            courses = set(r['course_id'] for r in matching)
+            courses = set(table['course_id'][i] for i in matching)
             print(f"  Courses Taught: {', '.join(sorted(courses))}")
         else:
             print(f"No records found for {instructor_id}")
     
     elif choice == "2":
         course_id = input("Enter course ID (e.g., COURSE01): ").strip().upper()
-        matching = [r for r in records if r['course_id'] == course_id]
+        matching = index['course_id'].get(course_id, [])
         
         if matching:
-            avg_score = sum(float(r['satisfaction_score']) for r in matching) / len(matching)
-            avg_difficulty = sum(int(r['difficulty_level']) for r in matching) / len(matching)
+            avg_score = sum(table['satisfaction_score'][i] for i in matching) / len(matching)
+            avg_difficulty = sum(table['difficulty_level'][i] for i in matching) / len(matching)
             print(f"\n{course_id} Results:")
             print(f"  Reviews: {len(matching)}")
             print(f"  Average Satisfaction: {avg_score:.2f}/5")
             print(f"  Average Difficulty: {avg_difficulty:.1f}/5")
             
-            instructors = set(r['instructor_id'] for r in matching)
+            instructors = set(table['instructor_id'][i] for i in matching)
             print(f"  Instructors: {', '.join(sorted(instructors))}")
         else:
             print(f"No records found for {course_id}")
     
     elif choice == "3":
         semester = input("Enter semester (e.g., Fall2024): ").strip()
-        matching = [r for r in records if semester.lower() in r['semester'].lower()]
+        matching = [
+            i
+            for value, rows in index['semester'].items()
+            if semester.lower() in value.lower()
+            for i in rows
+        ]
         
         if matching:
-            avg_score = sum(float(r['satisfaction_score']) for r in matching) / len(matching)
+            avg_score = sum(table['satisfaction_score'][i] for i in matching) / len(matching)
             print(f"\n{semester} Results:")
             print(f"  Reviews: {len(matching)}")
             print(f"  Average Satisfaction: {avg_score:.2f}/5")
             
-            courses = len(set(r['course_id'] for r in matching))
-            instructors = len(set(r['instructor_id'] for r in matching))
+            courses = len(set(table['course_id'][i] for i in matching))
+            instructors = len(set(table['instructor_id'][i] for i in matching))
             print(f"  Courses Offered: {courses}")
             print(f"  Active Instructors: {instructors}")
         else:
@@ -149,10 +165,12 @@ def custom_search(records):
 
 def main():
     """Main dashboard function"""
-    records = load_data()
-    if not records:
+    table = load_data()
+    if not table:
         return
     
+    index = build_index(table)
+    
     while True:
         choice = main_menu()
         
@@ -160,15 +178,15 @@ def main():
             print("👋 Goodbye!")
             break
         elif choice == "1":
-            quick_overview(records)
+            quick_overview(table)
         elif choice == "2":
-            instructor_rankings(records)
+            instructor_rankings(table)
         elif choice == "3":
             print("\n📚 Course analysis feature coming soon!")
         elif choice == "4":
             print("\n📈 Trends analysis feature coming soon!")
         elif choice == "5":
-            custom_search(records)
+            custom_search(table, index)
         else:
             print("❌ Invalid option. Please try again.")
         
@@ -4,46 +4,44 @@ Quick Data Summary Script
 Provides a quick overview of the processed data.
 """
 
-import csv
 import json
-from pathlib import Path
 from collections import Counter
 
-def load_processed_data():
-    """Load processed data"""
-    file_path = Path("data/processed/processed_feedback.csv")
+from _analytics import as_pct, count_distinct
+from _loader import PROCESSED_FILE, load_table
+
+# Columns read by print_summary
+SUMMARY_COLUMNS = (
+    'satisfaction_score', 'engagement_score', 'overall_rating',
+    'student_id', 'course_id', 'instructor_id', 'semester',
+    'performance_category', 'difficulty_category',
+)
+
+def load_processed_data(columns=SUMMARY_COLUMNS):
+    """Load processed data as a dict of typed columns"""
+    file_path = PROCESSED_FILE
     
     if not file_path.exists():
         print("❌ No processed data found. Run the ETL pipeline first!")
         return None
     
-    records = []
-    with open(file_path, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            # Convert numeric fields
-            row['satisfaction_score'] = float(row['satisfaction_score'])
-            row['engagement_score'] = float(row['engagement_score'])
-            row['overall_rating'] = int(row['overall_rating'])
-            records.append(row)
-    
-    return records
+    return load_table(columns)
 
-def print_summary(records):
+def print_summary(table):
     """Print data summary"""
-    if not records:
+    if not table:
         return
     
-    total = len(records)
+    total = len(table['satisfaction_score'])
     
     print("📊 ACADEMIC PULSE DATA SUMMARY")
     print("=" * 50)
     print(f"Total Feedback Records: {total}")
     
     # Basic stats
-    avg_satisfaction = sum(r['satisfaction_score'] for r in records) / total
-    avg_engagement = sum(r['engagement_score'] for r in records) / total
-    avg_overall = sum(r['overall_rating'] for r in records) / total
+    avg_satisfaction = sum(table['satisfaction_score']) / total
+    avg_engagement = sum(table['engagement_score']) / total
+    avg_overall = sum(table['overall_rating']) / total
     
     print(f"\n📈 Average Scores:")
     print(f"  Satisfaction: {avg_satisfaction:.2f}/5")
@@ -51,10 +49,11 @@ def print_summary(records):
     print(f"  Overall Rating: {avg_overall:.2f}/5")
     
     # Unique counts
-    unique_students = len(set(r['student_id'] for r in records))
-    unique_courses = len(set(r['course_id'] for r in records))
-    unique_instructors = len(set(r['instructor_id'] for r in records))
-    unique_semesters = len(set(r['semester'] for r in records))
+    unique = count_distinct(table, ('student_id', 'course_id', 'instructor_id', 'semester'))
+    unique_students = unique['student_id']
+    unique_courses = unique['course_id']
+    unique_instructors = unique['instructor_id']
+    unique_semesters = unique['semester']
     
     print(f"\n📋 Data Coverage:")
     print(f"  Students: {unique_students}")
@@ -63,27 +62,29 @@ def print_summary(records):
     print(f"  Semesters: {unique_semesters}")
     
     # Performance distribution
-    performance_dist = Counter(r['performance_category'] for r in records)
+    performance_dist = Counter(table['performance_category'])
+    performance_pct = as_pct(performance_dist, total)
     print(f"\n🏆 Performance Distribution:")
     for category in ['Excellent', 'Good', 'Fair', 'Poor']:
         if category in performance_dist:
             count = performance_dist[category]
-            pct = (count / total) * 100
+            pct = performance_pct[category]
             print(f"  {category}: {count} ({pct:.1f}%)")
     
     # Difficulty distribution
-    difficulty_dist = Counter(r['difficulty_category'] for r in records)
+    difficulty_dist = Counter(table['difficulty_category'])
+    difficulty_pct = as_pct(difficulty_dist, total)
     print(f"\n⚡ Difficulty Distribution:")
     for category in ['Easy', 'Moderate', 'Hard', 'Very Hard']:
         if category in difficulty_dist:
             count = difficulty_dist[category]
-            pct = (count / total) * 100
+            pct = difficulty_pct[category]
             print(f"  {category}: {count} ({pct:.1f}%)")
 
 def main():
-    records = load_processed_data()
-    if records:
-        print_summary(records)
+    table = load_processed_data()
+    if table:
+        print_summary(table)
     else:
         print("Run: python3 scripts/run_complete_etl.py")
 
@@ -5,16 +5,24 @@ Creates professional Excel reports with multiple sheets and formatting.
 """
 
 import csv
+import io
 import json
 from pathlib import Path
-from collections import defaultdict, Counter
 import datetime
 
+from _analytics import build_context, compute_metrics, group_distinct, group_means
+from _loader import PROCESSED_FILE, load_table
+
+def write_report(file_path, text):
+    """Write a report rendered in memory with a single write call"""
+    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        f.write(text)
+
 def create_excel_like_csv_reports():
     """Create multiple CSV reports formatted like Excel sheets"""
     
     # Load processed data
-    data_file = Path("data/processed/processed_feedback.csv")
+    data_file = PROCESSED_FILE
     if not data_file.exists():
         print("❌ No processed data found. Run the ETL pipeline first!")
         return
@@ -25,145 +33,131 @@ def create_excel_like_csv_reports():
     
     print("📊 Generating Excel-style reports...")
     
-    # Load data
-    records = []
-    with open(data_file, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            records.append(row)
+    # Load data as typed columns
+    table = load_table()
+    
+    print(f"📖 Processing {len(table['satisfaction_score'])} records...")
+    
+    # One timestamp for every report in this run
+    generated_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    print(f"📖 Processing {len(records)} records...")
+    # Headline figures, computed once
+    metrics = compute_metrics(build_context(table))
     
     # 1. Executive Summary Report
-    create_executive_summary_report(records, reports_dir)
+    create_executive_summary_report(metrics, reports_dir, generated_at)
     
     # 2. Instructor Performance Report
-    create_instructor_performance_report(records, reports_dir)
+    create_instructor_performance_report(table, reports_dir, generated_at)
     
     # 3. Course Analysis Report
-    create_course_analysis_report(records, reports_dir)
+    create_course_analysis_report(table, reports_dir, generated_at)
     
     # 4. Detailed Data Export
-    create_detailed_data_export(records, reports_dir)
+    create_detailed_data_export(table, reports_dir)
     
     # 5. Trend Analysis Report
-    create_trend_analysis_report(records, reports_dir)
+    create_trend_analysis_report(table, reports_dir, generated_at)
     
     print("✅ All Excel-style reports generated successfully!")
     print(f"📁 Reports saved in: {reports_dir}")
 
-def create_executive_summary_report(records, reports_dir):
+def create_executive_summary_report(metrics, reports_dir, generated_at):
     """Create executive summary report"""
     
-    # Calculate key metrics
-    total_records = len(records)
-    satisfaction_scores = [float(r['satisfaction_score']) for r in records]
-    avg_satisfaction = sum(satisfaction_scores) / len(satisfaction_scores)
-    
-    unique_students = len(set(r['student_id'] for r in records))
-    unique_courses = len(set(r['course_id'] for r in records))
-    unique_instructors = len(set(r['instructor_id'] for r in records))
-    unique_semesters = len(set(r['semester'] for r in records))
-    
-    # Performance distribution
-    performance_dist = Counter(r['performance_category'] for r in records)
-    
-    # Difficulty distribution
-    difficulty_dist = Counter(r['difficulty_category'] for r in records)
-    
     # Create executive summary CSV
     exec_file = reports_dir / "Executive_Summary_Report.csv"
     
-    with open(exec_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        
-        # Header
-        writer.writerow(["ACADEMIC PULSE ETL - EXECUTIVE SUMMARY REPORT"])
-        writer.writerow([f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
-        writer.writerow([])
-        
-        # Key Metrics
-        writer.writerow(["KEY PERFORMANCE INDICATORS"])
-        writer.writerow(["Metric", "Value"])
-        writer.writerow(["Total Feedback Records", total_records])
-        writer.writerow(["Average Satisfaction Score", f"{avg_satisfaction:.2f}/5.0"])
-        writer.writerow(["Students Surveyed", unique_students])
-        writer.writerow(["Courses Evaluated", unique_courses])
-        writer.writerow(["Instructors Assessed", unique_instructors])
-        writer.writerow(["Semesters Covered", unique_semesters])
-        writer.writerow([])
-        
-        # Performance Distribution
-        writer.writerow(["PERFORMANCE DISTRIBUTION"])
-        writer.writerow(["Category", "Count", "Percentage"])
-        for category, count in performance_dist.items():
-            percentage = (count / total_records) * 100
-            writer.writerow([category, count, f"{percentage:.1f}%"])
-        writer.writerow([])
-        
-        # Difficulty Distribution
-        writer.writerow(["DIFFICULTY DISTRIBUTION"])
-        writer.writerow(["Category", "Count", "Percentage"])
-        for category, count in difficulty_dist.items():
-            percentage = (count / total_records) * 100
-            writer.writerow([category, count, f"{percentage:.1f}%"])
+    # Header
+    rows = [
+        ["ACADEMIC PULSE ETL - EXECUTIVE SUMMARY REPORT"],
+        [f"Generated: {generated_at}"],
+        [],
+    ]
+    
+    # Key Metrics
+    rows += [
+        ["KEY PERFORMANCE INDICATORS"],
+        ["Metric", "Value"],
+        ["Total Feedback Records", metrics.total_records],
+        ["Average Satisfaction Score", f"{metrics.avg_satisfaction:.2f}/5.0"],
+        ["Students Surveyed", metrics.unique_students],
+        ["Courses Evaluated", metrics.unique_courses],
+        ["Instructors Assessed", metrics.unique_instructors],
+        ["Semesters Covered", metrics.unique_semesters],
+        [],
+    ]
+    
+    # Performance Distribution
+    rows += [["PERFORMANCE DISTRIBUTION"], ["Category", "Count", "Percentage"]]
+    for category, (count, percentage) in metrics.performance_dist.items():
+        rows.append([category, count, f"{percentage:.1f}%"])
+    rows.append([])
+    
+    # Difficulty Distribution
+    rows += [["DIFFICULTY DISTRIBUTION"], ["Category", "Count", "Percentage"]]
+    for category, (count, percentage) in metrics.difficulty_dist.items():
+        rows.append([category, count, f"{percentage:.1f}%"])
+    
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    write_report(exec_file, buffer.getvalue())
     
     print(f"✅ Executive Summary: {exec_file}")
 
-def create_instructor_performance_report(records, reports_dir):
+def create_instructor_performance_report(table, reports_dir, generated_at):
     """Create detailed instructor performance report"""
     
-    # Group by instructor
-    instructor_data = defaultdict(lambda: {
-        'ratings': [],
-        'satisfaction_scores': [],
-        'courses': set(),
-        'semesters': set(),
-        'engagement_scores': []
-    })
-    
-    for record in records:
-        instructor = record['instructor_id']
-        instructor_data[instructor]['ratings'].append(int(record['overall_rating']))
-        instructor_data[instructor]['satisfaction_scores'].append(float(record['satisfaction_score']))
-        instructor_data[instructor]['courses'].add(record['course_id'])
-        instructor_data[instructor]['semesters'].add(record['semester'])
-        instructor_data[instructor]['engagement_scores'].append(float(record['engagement_score']))
+    # Aggregate per instructor
+    instructors = table['instructor_id']
+    avg_satisfaction_by, _ = group_means(instructors, table['satisfaction_score'])
+    avg_engagement_by, _ = group_means(instructors, table['engagement_score'])
+    courses_taught_by = group_distinct(instructors, table['course_id'])
+    semesters_active_by = group_distinct(instructors, table['semester'])
+    
+    # Count, sum and sum of squares of ratings, for mean and spread in one pass
+    rating_sums = {}
+    for instructor, rating in zip(instructors, table['overall_rating']):
+        sums = rating_sums.get(instructor)
+        if sums is None:
+            rating_sums[instructor] = [1, rating, rating * rating]
+        else:
+            sums[0] += 1
+            sums[1] += rating
+            sums[2] += rating * rating
     
     # Create instructor performance CSV
     instructor_file = reports_dir / "Instructor_Performance_Report.csv"
     
-    with open(instructor_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        
-        # Header
-        writer.writerow(["INSTRUCTOR PERFORMANCE ANALYSIS"])
-        writer.writerow([f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
-        writer.writerow([])
-        
-        # Column headers
-        writer.writerow([
-            "Instructor ID", "Total Reviews", "Avg Overall Rating", 
-            "Avg Satisfaction", "Avg Engagement", "Courses Taught", 
-            "Semesters Active", "Rating Consistency", "Performance Grade"
-        ])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    # Header
+    writer.writerow(["INSTRUCTOR PERFORMANCE ANALYSIS"])
+    writer.writerow([f"Generated: {generated_at}"])
+    writer.writerow([])
+    
+    # Column headers
+    writer.writerow([
+        "Instructor ID", "Total Reviews", "Avg Overall Rating", 
+        "Avg Satisfaction", "Avg Engagement", "Courses Taught", 
+        "Semesters Active", "Rating Consistency", "Performance Grade"
+    ])
+    
+    # Calculate metrics for each instructor
+    instructor_metrics = []
+    for instructor, (total_reviews, rating_sum, rating_sum_sq) in rating_sums.items():
+        avg_rating = rating_sum / total_reviews
+        avg_satisfaction = avg_satisfaction_by[instructor]
+        avg_engagement = avg_engagement_by[instructor]
+        courses_taught = courses_taught_by[instructor]
+        semesters_active = semesters_active_by[instructor]
         
-        # Calculate metrics for each instructor
-        instructor_metrics = []
-        for instructor, data in instructor_data.items():
-            total_reviews = len(data['ratings'])
-            avg_rating = sum(data['ratings']) / len(data['ratings'])
-            avg_satisfaction = sum(data['satisfaction_scores']) / len(data['satisfaction_scores'])
-            avg_engagement = sum(data['engagement_scores']) / len(data['engagement_scores'])
-            courses_taught = len(data['courses'])
-            semesters_active = len(data['semesters'])
-            
-            # Calculate consistency (lower standard deviation = more consistent)
-            if len(data['ratings']) > 1:
-                mean_rating = avg_rating
-                variance = sum((r - mean_rating) ** 2 for r in data['ratings']) / len(data['ratings'])
-                std_dev = variance ** 0.5
-                consistency = max(0, 5 - std_dev)
+        # Calculate consistency (lower standard deviation = more consistent)
+        if total_reviews > 1:
+            variance = max(0.0, rating_sum_sq / total_reviews - avg_rating * avg_rating)
+            std_dev = variance ** 0.5
+            consistency = max(0, 5 - std_dev)
 
 elif score >= 3.5:
             grade = "B - Good"
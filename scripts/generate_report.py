@@ -4,248 +4,237 @@ Academic Pulse Comprehensive Report Generator
 Generates a detailed report with insights and recommendations.
 """
 
-import csv
-from pathlib import Path
-from collections import Counter, defaultdict
+import sys
+from operator import itemgetter
 from datetime import datetime
 
-def load_processed_data():
-    """Load processed feedback data"""
-    file_path = Path("data/processed/processed_feedback.csv")
-    
-    if not file_path.exists():
+from _analytics import (
+    build_context, count_distinct, distribution, grade_index, group_distinct, group_means,
+    top_n_by_group,
+)
+from _loader import PROCESSED_FILE, load_table
+
+# Columns read by the report sections
+REPORT_COLUMNS = (
+    'satisfaction_score', 'difficulty_level', 'student_id', 'course_id',
+    'instructor_id', 'semester', 'performance_category', 'difficulty_category',
+)
+
+def load_processed_data(columns=REPORT_COLUMNS):
+    """Load processed feedback data as typed columns"""
+    if not PROCESSED_FILE.exists():
         print("❌ No processed data found!")
         return None
     
-    records = []
-    with open(file_path, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            records.append(row)
-    
-    return records
+    return load_table(columns)
 
-def generate_executive_summary(records):
+def generate_executive_summary(ctx, generated_at):
     """Generate executive summary"""
-    total_records = len(records)
-    satisfaction_scores = [float(r['satisfaction_score']) for r in records]
-    avg_satisfaction = sum(satisfaction_scores) / len(satisfaction_scores)
+    lines = []
+    table = ctx['table']
+    total_records = len(table['satisfaction_score'])
+    avg_satisfaction = ctx['avg_satisfaction']
     
     # Count unique entities
-    unique_students = len(set(r['student_id'] for r in records))
-    unique_courses = len(set(r['course_id'] for r in records))
-    unique_instructors = len(set(r['instructor_id'] for r in records))
-    
-    print("📋 EXECUTIVE SUMMARY")
-    print("=" * 50)
-    print(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Analysis Period: Academic Year 2024")
-    print()
-    print(f"📊 Dataset Overview:")
-    print(f"  • Total Feedback Records: {total_records:,}")
-    print(f"  • Students Surveyed: {unique_students}")
-    print(f"  • Courses Evaluated: {unique_courses}")
-    print(f"  • Instructors Assessed: {unique_instructors}")
-    print()
-    print(f"📈 Key Performance Indicators:")
-    print(f"  • Overall Satisfaction Score: {avg_satisfaction:.2f}/5.0")
-    print(f"  • Performance Grade: {'A' if avg_satisfaction >= 4.0 else 'B' if avg_satisfaction >= 3.5 else 'C' if avg_satisfaction >= 3.0 else 'D'}")
+    unique = count_distinct(table, ('student_id', 'course_id', 'instructor_id'))
+    
+    lines.append("📋 EXECUTIVE SUMMARY")
+    lines.append("=" * 50)
+    lines.append(f"Report Generated: {generated_at}")
+    lines.append(f"Analysis Period: Academic Year 2024")
+    lines.append("")
+    lines.append(f"📊 Dataset Overview:")
+    lines.append(f"  • Total Feedback Records: {total_records:,}")
+    lines.append(f"  • Students Surveyed: {unique['student_id']}")
+    lines.append(f"  • Courses Evaluated: {unique['course_id']}")
+    lines.append(f"  • Instructors Assessed: {unique['instructor_id']}")
+    lines.append("")
+    lines.append(f"📈 Key Performance Indicators:")
+    lines.append(f"  • Overall Satisfaction Score: {avg_satisfaction:.2f}/5.0")
+    lines.append(f"  • Performance Grade: {'DCBA'[grade_index(avg_satisfaction)]}")
     
     # Calculate trend (if we had historical data, this would be real)
     trend = "↗️ Improving" if avg_satisfaction > 3.0 else "↘️ Declining"
-    print(f"  • Trend: {trend}")
+    lines.append(f"  • Trend: {trend}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def analyze_instructor_performance(records):
+def analyze_instructor_performance(ctx):
     """Detailed instructor analysis"""
-    print("\n🏆 INSTRUCTOR PERFORMANCE ANALYSIS")
-    print("=" * 50)
-    
-    instructor_data = defaultdict(lambda: {
-        'ratings': [],
-        'courses': set(),
-        'semesters': set()
-    })
-    
-    for record in records:
-        instructor = record['instructor_id']
-        satisfaction = float(record['satisfaction_score'])
-        instructor_data[instructor]['ratings'].append(satisfaction)
-        instructor_data[instructor]['courses'].add(record['course_id'])
-        instructor_data[instructor]['semesters'].add(record['semester'])
+    lines = ["\n🏆 INSTRUCTOR PERFORMANCE ANALYSIS", "=" * 50]
+    
+    table = ctx['table']
+    instructors = table['instructor_id']
+    rating_stats = ctx['by_instructor']
+    courses_taught = group_distinct(instructors, table['course_id'])
+    semesters_active = group_distinct(instructors, table['semester'])
     
     # Calculate instructor metrics
     instructor_metrics = []
-    for instructor, data in instructor_data.items():
-        avg_rating = sum(data['ratings']) / len(data['ratings'])
-        consistency = 1 - (max(data['ratings']) - min(data['ratings'])) / 4  # Consistency score
+    for instructor, stats in rating_stats.items():
+        consistency = 1 - (stats['max'] - stats['min']) / 4  # Consistency score
         instructor_metrics.append({
             'id': instructor,
-            'avg_rating': avg_rating,
-            'num_reviews': len(data['ratings']),
-            'courses_taught': len(data['courses']),
+            'avg_rating': stats['mean'],
+            'num_reviews': stats['count'],
+            'courses_taught': courses_taught[instructor],
             'consistency': consistency,
-            'semesters_active': len(data['semesters'])
+            'semesters_active': semesters_active[instructor]
         })
     
     # Sort by average rating
-    instructor_metrics.sort(key=lambda x: x['avg_rating'], reverse=True)
+    instructor_metrics.sort(key=itemgetter('avg_rating'), reverse=True)
     
-    print("Top Performing Instructors:")
-    print("┌────────────┬─────────┬─────────┬─────────┬─────────────┐")
-    print("│ Instructor │ Rating  │ Reviews │ Courses │ Consistency │")
-    print("├────────────┼─────────┼─────────┼─────────┼─────────────┤")
+    lines.append("Top Performing Instructors:")
+    lines.append("┌────────────┬─────────┬─────────┬─────────┬─────────────┐")
+    lines.append("│ Instructor │ Rating  │ Reviews │ Courses │ Consistency │")
+    lines.append("├────────────┼─────────┼─────────┼─────────┼─────────────┤")
     
     for i, instructor in enumerate(instructor_metrics[:5], 1):
         rating_stars = "★" * int(instructor['avg_rating']) + "☆" * (5 - int(instructor['avg_rating']))
         consistency_pct = instructor['consistency'] * 100
-        print(f"│ {instructor['id']:<10} │ {instructor['avg_rating']:5.2f}   │ {instructor['num_reviews']:7} │ {instructor['courses_taught']:7} │ {consistency_pct:8.1f}%   │")
+        lines.append(f"│ {instructor['id']:<10} │ {instructor['avg_rating']:5.2f}   │ {instructor['num_reviews']:7} │ {instructor['courses_taught']:7} │ {consistency_pct:8.1f}%   │")
     
-    print("└────────────┴─────────┴─────────┴─────────┴─────────────┘")
+    lines.append("└────────────┴─────────┴─────────┴─────────┴─────────────┘")
     
     # Identify areas for improvement
     low_performers = [i for i in instructor_metrics if i['avg_rating'] < 2.5]
     if low_performers:
-        print(f"\n⚠️  Instructors Needing Support ({len(low_performers)} total):")
+        lines.append(f"\n⚠️  Instructors Needing Support ({len(low_performers)} total):")
         for instructor in low_performers:
-            print(f"  • {instructor['id']}: {instructor['avg_rating']:.2f}/5 ({instructor['num_reviews']} reviews)")
+            lines.append(f"  • {instructor['id']}: {instructor['avg_rating']:.2f}/5 ({instructor['num_reviews']} reviews)")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def analyze_course_performance(records):
+def analyze_course_performance(ctx):
     """Detailed course analysis"""
-    print("\n📚 COURSE PERFORMANCE ANALYSIS")
-    print("=" * 50)
-    
-    course_data = defaultdict(lambda: {
-        'satisfaction_scores': [],
-        'difficulty_scores': [],
-        'instructors': set(),
-        'semesters': set()
-    })
-    
-    for record in records:
-        course = record['course_id']
-        course_data[course]['satisfaction_scores'].append(float(record['satisfaction_score']))
-        course_data[course]['difficulty_scores'].append(int(record['difficulty_level']))
-        course_data[course]['instructors'].add(record['instructor_id'])
-        course_data[course]['semesters'].add(record['semester'])
-    
-    # Calculate course metrics
-    course_metrics = []
-    for course, data in course_data.items():
-        avg_satisfaction = sum(data['satisfaction_scores']) / len(data['satisfaction_scores'])
-        avg_difficulty = sum(data['difficulty_scores']) / len(data['difficulty_scores'])
-        
-        course_metrics.append({
+    lines = ["\n📚 COURSE PERFORMANCE ANALYSIS", "=" * 50]
+    
+    table = ctx['table']
+    courses = table['course_id']
+    satisfaction_stats = ctx['by_course']
+    avg_difficulty, _ = group_means(courses, table['difficulty_level'])
+    instructors_count = group_distinct(courses, table['instructor_id'])
+    semesters_offered = group_distinct(courses, table['semester'])
+    
+    # Calculate metrics for the top courses by satisfaction
+    top_courses = []
+    for course, avg_satisfaction in top_n_by_group(satisfaction_stats):
+        top_courses.append({
             'id': course,
             'avg_satisfaction': avg_satisfaction,
-            'avg_difficulty': avg_difficulty,
-            'num_reviews': len(data['satisfaction_scores']),
-            'instructors_count': len(data['instructors']),
-            'semesters_offered': len(data['semesters'])
+            'avg_difficulty': avg_difficulty[course],
+            'num_reviews': satisfaction_stats[course]['count'],
+            'instructors_count': instructors_count[course],
+            'semesters_offered': semesters_offered[course]
         })
     
-    # Sort by satisfaction
-    course_metrics.sort(key=lambda x: x['avg_satisfaction'], reverse=True)
+    lines.append("Top Performing Courses:")
+    lines.append("┌───────────┬─────────────┬────────────┬─────────┬─────────────┐")
+    lines.append("│ Course    │ Satisfaction│ Difficulty │ Reviews │ Instructors │")
+    lines.append("├───────────┼─────────────┼────────────┼─────────┼─────────────┤")
     
-    print("Top Performing Courses:")
-    print("┌───────────┬─────────────┬────────────┬─────────┬─────────────┐")
-    print("│ Course    │ Satisfaction│ Difficulty │ Reviews │ Instructors │")
-    print("├───────────┼─────────────┼────────────┼─────────┼─────────────┤")
-    
-    for course in course_metrics[:5]:
+    for course in top_courses:
         difficulty_text = ["Easy", "Easy", "Moderate", "Hard", "Very Hard"][int(course['avg_difficulty'])-1]
-        print(f"│ {course['id']:<9} │ {course['avg_satisfaction']:11.2f} │ {difficulty_text:<10} │ {course['num_reviews']:7} │ {course['instructors_count']:11} │")
+        lines.append(f"│ {course['id']:<9} │ {course['avg_satisfaction']:11.2f} │ {difficulty_text:<10} │ {course['num_reviews']:7} │ {course['instructors_count']:11} │")
+    
+    lines.append("└───────────┴─────────────┴────────────┴─────────┴─────────────┘")
     
-    print("└───────────┴─────────────┴────────────┴─────────┴─────────────┘")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def analyze_trends_and_patterns(records):
+def analyze_trends_and_patterns(ctx):
     """Analyze trends and patterns"""
-    print("\n📈 TRENDS & PATTERNS ANALYSIS")
-    print("=" * 50)
+    lines = ["\n📈 TRENDS & PATTERNS ANALYSIS", "=" * 50]
+    
+    table = ctx['table']
     
     # Semester analysis
-    semester_data = defaultdict(list)
-    for record in records:
-        semester_data[record['semester']].append(float(record['satisfaction_score']))
+    semester_stats = ctx['by_semester']
     
-    print("Semester Performance:")
-    for semester in sorted(semester_data.keys()):
-        avg_score = sum(semester_data[semester]) / len(semester_data[semester])
-        count = len(semester_data[semester])
-        print(f"  • {semester}: {avg_score:.2f}/5 ({count} reviews)")
+    lines.append("Semester Performance:")
+    for semester in sorted(semester_stats.keys()):
+        stats = semester_stats[semester]
+        lines.append(f"  • {semester}: {stats['mean']:.2f}/5 ({stats['count']} reviews)")
     
     # Difficulty vs Satisfaction correlation
-    difficulty_satisfaction = defaultdict(list)
-    for record in records:
-        difficulty_satisfaction[record['difficulty_category']].append(float(record['satisfaction_score']))
+    difficulty_averages, difficulty_counts = group_means(
+        table['difficulty_category'], table['satisfaction_score']
+    )
     
-    print("\nDifficulty vs Satisfaction Correlation:")
+    lines.append("\nDifficulty vs Satisfaction Correlation:")
     for difficulty in ['Easy', 'Moderate', 'Hard', 'Very Hard']:
-        if difficulty in difficulty_satisfaction:
-            scores = difficulty_satisfaction[difficulty]
-            avg_score = sum(scores) / len(scores)
-            count = len(scores)
-            print(f"  • {difficulty} courses: {avg_score:.2f}/5 ({count} courses)")
+        if difficulty in difficulty_averages:
+            avg_score = difficulty_averages[difficulty]
+            count = difficulty_counts[difficulty]
+            lines.append(f"  • {difficulty} courses: {avg_score:.2f}/5 ({count} courses)")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def generate_recommendations(records):
+def generate_recommendations(ctx):
     """Generate actionable recommendations"""
-    print("\n💡 STRATEGIC RECOMMENDATIONS")
-    print("=" * 50)
+    lines = ["\n💡 STRATEGIC RECOMMENDATIONS", "=" * 50]
     
-    satisfaction_scores = [float(r['satisfaction_score']) for r in records]
-    avg_satisfaction = sum(satisfaction_scores) / len(satisfaction_scores)
+    table = ctx['table']
+    avg_satisfaction = ctx['avg_satisfaction']
     
-    print("🎯 Priority Actions:")
+    lines.append("🎯 Priority Actions:")
     
     if avg_satisfaction < 3.0:
-        print("  1. 🚨 URGENT: Overall satisfaction below acceptable threshold")
-        print("     → Implement immediate instructor training programs")
-        print("     → Review course content and delivery methods")
+        lines.append("  1. 🚨 URGENT: Overall satisfaction below acceptable threshold")
+        lines.append("     → Implement immediate instructor training programs")
+        lines.append("     → Review course content and delivery methods")
     elif avg_satisfaction < 3.5:
-        print("  1. ⚠️  Moderate improvement needed in overall satisfaction")
-        print("     → Focus on instructor development initiatives")
-        print("     → Enhance student support services")
+        lines.append("  1. ⚠️  Moderate improvement needed in overall satisfaction")
+        lines.append("     → Focus on instructor development initiatives")
+        lines.append("     → Enhance student support services")
     else:
-        print("  1. ✅ Overall satisfaction is good, focus on excellence")
-        print("     → Share best practices from top performers")
-        print("     → Implement advanced teaching methodologies")
+        lines.append("  1. ✅ Overall satisfaction is good, focus on excellence")
+        lines.append("     → Share best practices from top performers")
+        lines.append("     → Implement advanced teaching methodologies")
     
     # Find performance gaps
-    performance_dist = Counter(r['performance_category'] for r in records)
-    poor_percentage = (performance_dist.get('Poor', 0) / len(records)) * 100
+    _, poor_percentage = distribution(table['performance_category']).get('Poor', (0, 0.0))
     
     if poor_percentage > 30:
-        print("  2. 📊 High percentage of poor-performing courses detected")
-        print(f"     → {poor_percentage:.1f}% of courses rated as 'Poor'")
-        print("     → Implement targeted intervention programs")
-    
-    print("\n🔄 Continuous Improvement:")
-    print("  • Establish monthly feedback review cycles")
-    print("  • Create peer mentoring programs for instructors")
-    print("  • Implement student success tracking systems")
-    print("  • Develop course content refresh schedules")
-    
-    print("\n📊 Metrics to Monitor:")
-    print("  • Instructor satisfaction scores (target: >3.5)")
-    print("  • Course completion rates")
-    print("  • Student engagement levels")
-    print("  • Semester-over-semester improvement trends")
+        lines.append("  2. 📊 High percentage of poor-performing courses detected")
+        lines.append(f"     → {poor_percentage:.1f}% of courses rated as 'Poor'")
+        lines.append("     → Implement targeted intervention programs")
+    
+    lines.append("\n🔄 Continuous Improvement:")
+    lines.append("  • Establish monthly feedback review cycles")
+    lines.append("  • Create peer mentoring programs for instructors")
+    lines.append("  • Implement student success tracking systems")
+    lines.append("  • Develop course content refresh schedules")
+    
+    lines.append("\n📊 Metrics to Monitor:")
+    lines.append("  • Instructor satisfaction scores (target: >3.5)")
+    lines.append("  • Course completion rates")
+    lines.append("  • Student engagement levels")
+    lines.append("  • Semester-over-semester improvement trends")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Generate comprehensive report"""
     print("🎓 ACADEMIC PULSE COMPREHENSIVE REPORT")
     print("=" * 60)
     
-    records = load_processed_data()
-    if not records:
+    table = load_processed_data()
+    if not table:
         print("Please run the ETL pipeline first!")
         return
     
+    # Shared aggregates, computed once for all sections
+    ctx = build_context(table)
+    
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
     # Generate all sections
-    generate_executive_summary(records)
-    analyze_instructor_performance(records)
-    analyze_course_performance(records)
-    analyze_trends_and_patterns(records)
-    generate_recommendations(records)
+    generate_executive_summary(ctx, generated_at)
+    analyze_instructor_performance(ctx)
+    analyze_course_performance(ctx)
+    analyze_trends_and_patterns(ctx)
+    generate_recommendations(ctx)
     
     print("\n" + "=" * 60)
     print("📋 Report Generation Complete!")
@@ -6,11 +6,20 @@ This script runs the entire ETL process in the correct order.
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add src to Python path
 sys.path.append('src')
 
+# Report generators that only read the processed data, as (module, function).
+# generate_excel_reports is left out: part of that module is missing in this
+# tree and it does not import. Add its create_excel_like_csv_reports and
+# create_html_report back here once it is restored.
+REPORT_GENERATORS = (
+    ('generate_report', 'main'),
+)
+
 def run_extraction():
     """Run data extraction"""
     print("=" * 60)
@@ -43,11 +52,13 @@ def run_transformation():
         
         transformer = StudentFeedbackTransformer()
         result = transformer.transform()
+        if result is None:
+            print("❌ Transformation failed: no raw records to transform")
+            return False, None
         
         print(f"✅ Transformation completed successfully!")
-        print(f"   - Records processed: {result['quality_report']['records_processed']}")
-        print(f"   - Records cleaned: {result['quality_report']['records_cleaned']}")
-        print(f"   - Data quality score: {result['quality_report']['data_quality_score']}%")
+        print(f"   - Records processed: {result['records_processed']}")
+        print(f"   - File saved: {result['processed_file']}")
         
         return True, result
     except Exception as e:
@@ -68,101 +79,65 @@ def run_analysis():
             print("❌ No processed data file found")
             return False, None
         
-        import csv
-        from collections import defaultdict, Counter
-        
-        # Load data
-        records = []
-        with open(processed_file, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                records.append(row)
+        from _analytics import build_context, compute_metrics
+        from _loader import load_table
         
-        print(f"📖 Loaded {len(records)} processed records")
+        # Load data as typed columns and compute shared group statistics once
+        table = load_table()
+        ctx = build_context(table)
+        metrics = compute_metrics(ctx)
+        total_records = metrics.total_records
         
-        # Basic analysis
-        total_records = len(records)
-        
-        # Convert numeric fields
-        for record in records:
-            record['satisfaction_score'] = float(record['satisfaction_score'])
-            record['engagement_score'] = float(record['engagement_score'])
-            record['overall_rating'] = int(record['overall_rating'])
+        print(f"📖 Loaded {total_records} processed records")
         
         # Calculate averages
-        avg_satisfaction = sum(r['satisfaction_score'] for r in records) / total_records
-        avg_engagement = sum(r['engagement_score'] for r in records) / total_records
-        avg_overall = sum(r['overall_rating'] for r in records) / total_records
+        avg_satisfaction = metrics.avg_satisfaction
+        avg_engagement = metrics.avg_engagement
+        avg_overall = sum(table['overall_rating']) / total_records
         
         print(f"\n📈 OVERALL STATISTICS:")
         print(f"   Average Satisfaction Score: {avg_satisfaction:.2f}/5")
-        print(f"   Average Engagement Score: {avg_engagement:.2f}/5")
+        if avg_engagement is not None:
+            print(f"   Average Engagement Score: {avg_engagement:.2f}/5")
         print(f"   Average Overall Rating: {avg_overall:.2f}/5")
         
         # Performance distribution
-        performance_dist = Counter(r['performance_category'] for r in records)
+        performance_dist = metrics.performance_dist
         print(f"\n🏆 PERFORMANCE DISTRIBUTION:")
-        for category, count in performance_dist.items():
-            percentage = (count / total_records) * 100
+        for category, (count, percentage) in performance_dist.items():
             print(f"   {category}: {count} ({percentage:.1f}%)")
         
         # Top instructors
-        instructor_scores = defaultdict(list)
-        for record in records:
-            instructor_scores[record['instructor_id']].append(record['satisfaction_score'])
-        
-        instructor_averages = {
-            instructor: sum(scores) / len(scores)
-            for instructor, scores in instructor_scores.items()
-        }
-        
-        top_instructors = sorted(instructor_averages.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_instructors = metrics.top_instructors
         print(f"\n🥇 TOP 5 INSTRUCTORS:")
         for i, (instructor, score) in enumerate(top_instructors, 1):
             print(f"   {i}. {instructor}: {score:.2f}/5")
         
         # Course analysis
-        course_scores = defaultdict(list)
-        for record in records:
-            course_scores[record['course_id']].append(record['satisfaction_score'])
-        
-        course_averages = {
-            course: sum(scores) / len(scores)
-            for course, scores in course_scores.items()
-        }
-        
-        top_courses = sorted(course_averages.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_courses = metrics.top_courses
         print(f"\n📚 TOP 5 COURSES:")
         for i, (course, score) in enumerate(top_courses, 1):
             print(f"   {i}. {course}: {score:.2f}/5")
         
         # Difficulty analysis
-        difficulty_dist = Counter(r['difficulty_category'] for r in records)
+        difficulty_dist = metrics.difficulty_dist
         print(f"\n⚡ DIFFICULTY DISTRIBUTION:")
-        for category, count in difficulty_dist.items():
-            percentage = (count / total_records) * 100
+        for category, (count, percentage) in difficulty_dist.items():
             print(f"   {category}: {count} ({percentage:.1f}%)")
         
-        # Department analysis
-        dept_scores = defaultdict(list)
-        for record in records:
-            dept_scores[record['department']].append(record['satisfaction_score'])
-        
-        dept_averages = {
-            dept: sum(scores) / len(scores)
-            for dept, scores in dept_scores.items()
-        }
+        # Department analysis, when the processed data has departments
+        dept_stats = ctx.get('by_department')
         
-        print(f"\n🏢 DEPARTMENT PERFORMANCE:")
-        for dept, score in sorted(dept_averages.items(), key=lambda x: x[1], reverse=True):
-            count = len(dept_scores[dept])
-            print(f"   {dept}: {score:.2f}/5 (n={count})")
+        if dept_stats:
+            print(f"\n🏢 DEPARTMENT PERFORMANCE:")
+            for dept, stats in sorted(dept_stats.items(), key=lambda x: x[1]['mean'], reverse=True):
+                print(f"   {dept}: {stats['mean']:.2f}/5 (n={stats['count']})")
         
         return True, {
             'total_records': total_records,
             'avg_satisfaction': avg_satisfaction,
             'avg_engagement': avg_engagement,
-            'performance_dist': dict(performance_dist),
+            'performance_dist': {category: count for category, (count, _) in performance_dist.items()},
             'top_instructors': top_instructors[:3],
             'top_courses': top_courses[:3]
         }
@@ -171,6 +146,51 @@ def run_analysis():
         print(f"❌ Analysis failed: {e}")
         return False, None
 
+def _call_report(module_name, function_name):
+    """Import one report generator and run it"""
+    import importlib
+    
+    getattr(importlib.import_module(module_name), function_name)()
+
+def _run_report(module_name, function_name):
+    """Run one report generator and return everything it printed"""
+    import io
+    from contextlib import redirect_stdout
+    
+    output = io.StringIO()
+    with redirect_stdout(output):
+        _call_report(module_name, function_name)
+    return output.getvalue()
+
+def run_reports():
+    """Run the independent report generators, in parallel processes when there are several"""
+    print("\n" + "=" * 60)
+    print("📑 STEP 4: REPORT GENERATION")
+    print("=" * 60)
+    
+    try:
+        # A worker pool only pays off with at least two jobs to overlap;
+        # a single generator runs inline without process startup or capture
+        if len(REPORT_GENERATORS) < 2:
+            for module_name, function_name in REPORT_GENERATORS:
+                _call_report(module_name, function_name)
+            return True
+        
+        with ProcessPoolExecutor(max_workers=len(REPORT_GENERATORS)) as executor:
+            futures = [
+                executor.submit(_run_report, module_name, function_name)
+                for module_name, function_name in REPORT_GENERATORS
+            ]
+            
+            # Print each report's output whole, in a fixed order
+            for future in futures:
+                print(future.result(), end="")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Report generation failed: {e}")
+        return False
+
 def main():
     """Run complete ETL pipeline"""
     print("🎓 ACADEMIC PULSE ETL PIPELINE")
@@ -194,6 +214,11 @@ def main():
         print("❌ Pipeline failed at analysis step")
         return
     
+    # Step 4: Reports
+    if not run_reports():
+        print("❌ Pipeline failed at report generation step")
+        return
+    
     # Final summary
     print("\n" + "=" * 60)
     print("🎉 ETL PIPELINE COMPLETED SUCCESSFULLY!")
@@ -201,16 +226,13 @@ def main():
     
     print(f"\n📊 FINAL SUMMARY:")
     print(f"   Raw records extracted: {len(extract_result['records'])}")
-    print(f"   Records processed: {transform_result['quality_report']['records_cleaned']}")
-    print(f"   Data quality score: {transform_result['quality_report']['data_quality_score']}%")
+    print(f"   Records processed: {transform_result['records_processed']}")
     print(f"   Average satisfaction: {analyze_result['avg_satisfaction']:.2f}/5")
     
     print(f"\n📁 FILES CREATED:")
     print(f"   - Raw data: data/raw/student_feedback.csv")
     print(f"   - Processed data: data/processed/processed_feedback.csv")
-    print(f"   - Metadata: data/raw/metadata.json")
-    print(f"   - Quality report: data/processed/data_quality_report.json")
-    print(f"   - Aggregations: data/processed/aggregations.json")
+    print(f"   - Reports: reports/")
     
     print(f"\n🏆 TOP PERFORMERS:")
     for i, (instructor, score) in enumerate(analyze_result['top_instructors'], 1):
@@ -1,6 +1,33 @@
 import csv
+import sys
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 
+# Ratings averaged into the satisfaction score
+SATISFACTION_FIELDS = (
+    'overall_rating', 'course_content_rating', 'instructor_effectiveness', 'recommendation_score'
+)
+
+# Low-cardinality text fields; interned by load_raw_data so repeated values share one string
+CATEGORICAL_FIELDS = ('course_id', 'instructor_id', 'semester', 'feedback_date')
+
+# Calculated fields appended to the raw columns in the processed CSV
+ENHANCED_FIELDS = ('satisfaction_score', 'difficulty_category', 'performance_category')
+
+# Category labels indexed by difficulty level, clamped to 1-5 so levels
+# below 1 stay 'Easy' and levels above 5 stay 'Very Hard'
+DIFFICULTY_LABELS = ('', 'Easy', 'Easy', 'Moderate', 'Hard', 'Very Hard')
+
+# Category labels indexed by the whole part of the satisfaction score,
+# clamped to 0-5 so out-of-range scores keep the Poor/Excellent catch-alls
+PERFORMANCE_LABELS = ('Poor', 'Poor', 'Poor', 'Good', 'Excellent', 'Excellent')
+
+# Enhanced records written per batch by transform()
+CHUNK_SIZE = 50_000
+
+_satisfaction_ratings = itemgetter(*SATISFACTION_FIELDS)
+
 class StudentFeedbackTransformer:
     def __init__(self):
         self.input_dir = Path("data/raw")
@@ -8,6 +35,31 @@ class StudentFeedbackTransformer:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         print("🔄 Data transformer initialized")
     
+    def _processed_fields(self, raw_fields):
+        """Processed CSV columns: every raw column, then any calculated field not already among them"""
+        fields = list(raw_fields)
+        return fields + [name for name in ENHANCED_FIELDS if name not in fields]
+    
+    def _intern_categorical(self, rows, header):
+        """Yield rows with their categorical fields interned"""
+        categorical = [i for i, name in enumerate(header) if name in CATEGORICAL_FIELDS]
+        
+        for row in rows:
+            for position in categorical:
+                row[position] = sys.intern(row[position])
+            yield row
+    
+    def _iter_raw_records(self, reader, header, intern=False):
+        """Iterate raw records as dicts keyed by the already-read header.
+        
+        intern=True shares one string per repeated categorical value, which
+        only saves memory when the records are kept, as in load_raw_data.
+        """
+        rows = filter(None, reader)  # Skip blank lines, as DictReader does
+        if intern:
+            rows = self._intern_categorical(rows, header)
+        return (dict(zip(header, row)) for row in rows)
+    
     def load_raw_data(self, filename="student_feedback.csv"):
         file_path = self.input_dir / filename
         
@@ -15,50 +67,35 @@ class StudentFeedbackTransformer:
             print(f"❌ File not found: {file_path}")
             return None
         
-        records = []
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                records.append(row)
+        with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            records = list(self._iter_raw_records(reader, header, intern=True))
         
         print(f"📖 Loaded {len(records)} records")
         return records
     
+    def _enhance_record(self, record):
+        # Calculate satisfaction score; a mean of four whole ratings is an
+        # exact quarter, so it needs no rounding
+        satisfaction_score = sum(map(int, _satisfaction_ratings(record))) / 4
+        record['satisfaction_score'] = satisfaction_score
+        
+        # Add difficulty and performance categories by table lookup
+        difficulty = min(max(int(record['difficulty_level']), 1), 5)
+        record['difficulty_category'] = DIFFICULTY_LABELS[difficulty]
+        record['performance_category'] = PERFORMANCE_LABELS[min(max(int(satisfaction_score), 0), 5)]
+        
+        return record
+    
+    def _iter_enhanced(self, reader, header):
+        """Yield enhanced records straight from the raw CSV reader"""
+        return map(self._enhance_record, self._iter_raw_records(reader, header))
+    
     def enhance_data(self, records):
         print("➕ Enhancing data with calculated fields...")
         
-        enhanced_records = []
-        for record in records:
-            # Convert to numbers
-            overall = int(record['overall_rating'])
-            content = int(record['course_content_rating'])
-            instructor = int(record['instructor_effectiveness'])
-            recommendation = int(record['recommendation_score'])
-            
-            # Calculate satisfaction score
-            satisfaction_score = (overall + content + instructor + recommendation) / 4
-            record['satisfaction_score'] = round(satisfaction_score, 2)
-            
-            # Add difficulty category
-            difficulty = int(record['difficulty_level'])
-            if difficulty <= 2:
-                record['difficulty_category'] = 'Easy'
-            elif difficulty == 3:
-                record['difficulty_category'] = 'Moderate'
-            elif difficulty == 4:
-                record['difficulty_category'] = 'Hard'
-            else:
-                record['difficulty_category'] = 'Very Hard'
-            
-            # Add performance category
-            if satisfaction_score >= 4:
-                record['performance_category'] = 'Excellent'
-            elif satisfaction_score >= 3:
-                record['performance_category'] = 'Good'
-            else:
-                record['performance_category'] = 'Poor'
-            
-            enhanced_records.append(record)
+        enhanced_records = [self._enhance_record(record) for record in records]
         
         print(f"✅ Enhanced {len(enhanced_records)} records")
         return enhanced_records
@@ -67,32 +104,64 @@ class StudentFeedbackTransformer:
         file_path = self.output_dir / filename
         
         if records:
-            fieldnames = list(records[0].keys())
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer = csv.DictWriter(csvfile, fieldnames=self._processed_fields(records[0]))
                 writer.writeheader()
                 writer.writerows(records)
         
         print(f"💾 Saved processed data to {file_path}")
         return file_path
     
-    def transform(self):
+    def transform(self, filename="student_feedback.csv", chunk_size=CHUNK_SIZE):
+        """Stream the raw CSV through enhancement into the processed CSV.
+        
+        Returns records_processed, sample_record (the first enhanced record)
+        and processed_file, or None if there is no input. The enhanced records
+        themselves are not kept; use load_raw_data and enhance_data for an
+        in-memory list.
+        """
         print("🚀 Starting data transformation...")
         
-        # Load raw data
-        raw_records = self.load_raw_data()
-        if not raw_records:
+        input_path = self.input_dir / filename
+        if not input_path.exists():
+            print(f"❌ File not found: {input_path}")
             return None
         
-        # Enhance data
-        enhanced_records = self.enhance_data(raw_records)
+        processed_file = self.output_dir / "processed_feedback.csv"
+        
+        # Records are enhanced as they are read and written in fixed-size
+        # batches, so at most one batch is held in memory
+        with open(input_path, 'r', encoding='utf-8', newline='') as infile:
+            reader = csv.reader(infile)
+            header = next(reader, [])
+            enhanced = self._iter_enhanced(reader, header)
+            sample_record = next(enhanced, None)
+            if sample_record is None:
+                print("📖 Loaded 0 records")
+                return None
+            
+            print(f"➕ Enhancing data in chunks of {chunk_size:,} records...")
+            
+            with open(processed_file, 'w', newline='', encoding='utf-8') as outfile:
+                writer = csv.DictWriter(outfile, fieldnames=self._processed_fields(header))
+                writer.writeheader()
+                writer.writerow(sample_record)
+                records_processed = 1
+                
+                while True:
+                    chunk = list(islice(enhanced, chunk_size))
+                    if not chunk:
+                        break
+                    writer.writerows(chunk)
+                    records_processed += len(chunk)
         
-        # Save processed data
-        processed_file = self.save_processed_data(enhanced_records)
+        print(f"✅ Enhanced {records_processed} records")
+        print(f"💾 Saved processed data to {processed_file}")
         
         print("✅ Data transformation completed!")
         return {
-            'processed_records': enhanced_records,
+            'records_processed': records_processed,
+            'sample_record': sample_record,
             'processed_file': processed_file
         }
 
@@ -102,6 +171,6 @@ if __name__ == "__main__":
     
     if result:
         print(f"\n📊 Sample enhanced record:")
-        sample = result['processed_records'][0]
+        sample = result['sample_record']
         for key, value in sample.items():
             print(f"  {key}: {value}")